@@ -1,17 +1,21 @@
 import numpy as np
 
+from dat_loader import load_dat
+
 def analyze_dat_file(filename):
-    data = np.loadtxt(filename)
+    # Cached fast loader: C-tokenizer parse on the first run, memory-mapped
+    # .npy on reruns
+    data = load_dat(filename)
     print(f"Data shape: {data.shape}")
-    
+
     if data.shape[1] >= 3:  # If we have x,y,z coordinates
-        x = np.unique(data[:, 0])
-        y = np.unique(data[:, 1])
-        z = np.unique(data[:, 2])
-        
-        print(f"Number of unique X coordinates: {len(x)}")
-        print(f"Number of unique Y coordinates: {len(y)}")
-        print(f"Number of unique Z coordinates: {len(z)}")
+        x = data[:, 0]
+        y = data[:, 1]
+        z = data[:, 2]
+
+        print(f"Number of unique X coordinates: {np.unique(x).size}")
+        print(f"Number of unique Y coordinates: {np.unique(y).size}")
+        print(f"Number of unique Z coordinates: {np.unique(z).size}")
         print(f"X range: {x.min()} to {x.max()}")
         print(f"Y range: {y.min()} to {y.max()}")
         print(f"Z range: {z.min()} to {z.max()}")
@@ -21,4 +25,4 @@ def analyze_dat_file(filename):
         print(f"Possible cubic dimension: {int(np.cbrt(len(data)))}")
 
 filename = "/Users/zanskar_junjie/Downloads/LDG-ver5-L90.DAT"
-analyze_dat_file(filename) 
\ No newline at end of file
+analyze_dat_file(filename)
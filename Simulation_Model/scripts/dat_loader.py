@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Shared loader for the whitespace-delimited .DAT grid dumps."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+def load_dat(filename, skiprows=0):
+    """
+    Load a .DAT file as a float32 array, caching the parsed result.
+
+    The first run parses with pandas' C tokenizer (5-10x faster than
+    np.loadtxt's pure-Python one) and dumps a .npy next to the source;
+    later runs memory-map the cache and skip parsing entirely. The cache
+    is invalidated whenever the .DAT file is newer than it.
+    """
+    # Keyed by skiprows too: the same dump is read with and without its
+    # header lines by different scripts
+    cache_path = f"{filename}.skip{skiprows}.npy" if skiprows else filename + '.npy'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(filename):
+        return np.load(cache_path, mmap_mode='r')
+
+    # comment='#' matches np.loadtxt's default: the grid dumps carry
+    # '#'-prefixed header lines even when read with skiprows=0
+    arr = pd.read_csv(filename, sep=r'\s+', header=None, engine='c',
+                      dtype=np.float32, skiprows=skiprows, comment='#').to_numpy()
+    np.save(cache_path, arr)
+    return arr
@@ -1,11 +1,15 @@
+import os
 import numpy as np
 import pyvista as pv
-from scipy.interpolate import griddata
+from scipy.interpolate import LinearNDInterpolator
+
+from dat_loader import load_dat
 import matplotlib.pyplot as plt
 
 def read_and_analyze_dat_file(filename):
-    # Read the data, skipping the first two lines (header)
-    data = np.loadtxt(filename, skiprows=2)
+    # Read the data, skipping the first two lines (header); the cached
+    # loader parses with pandas' C tokenizer and memory-maps reruns
+    data = load_dat(filename, skiprows=2)
     
     # Extract X, Y, Z coordinates and permeability values
     x = data[:, 0]
@@ -18,41 +22,76 @@ def read_and_analyze_dat_file(filename):
 def analyze_distribution(values):
     """Analyze the distribution of permeability values"""
     print("\nPermeability Distribution Analysis:")
+
+    # Compute the threshold mask and subset once; every above-threshold
+    # statistic below reuses them instead of re-filtering the array
+    threshold = 100
+    above = values[values > threshold]
+
     print(f"Min value: {values.min():.2f}")
     print(f"Max value: {values.max():.2f}")
     print(f"Mean value: {values.mean():.2f}")
     print(f"Median value: {np.median(values):.2f}")
-    
-    # Count values above threshold
-    threshold = 100
-    count = np.sum(values > threshold)
+
+    count = above.size
     percentage = (count / len(values)) * 100
     print(f"\nValues above {threshold}: {count} ({percentage:.2f}%)")
     if count > 0:
-        print(f"Unique values above {threshold}: {np.unique(values[values > threshold])}")
+        print(f"Unique values above {threshold}: {np.unique(above)}")
+
+def interpolate_with_cache(source_file, points, values, grid_points, resolution):
+    """Interpolate onto the regular grid, caching the result on disk.
 
-def visualize_with_pyvista(x, y, z, values, threshold=100, resolution=50):
+    The cache is keyed by the source file's mtime and the resolution, so
+    tweaking threshold or camera settings on a rerun skips the expensive
+    interpolation entirely; the cached array is memory-mapped back in.
+    """
+    cache_path = f"{source_file}.{os.path.getmtime(source_file):.0f}.r{resolution}.npy"
+    if os.path.exists(cache_path):
+        print(f"Loading cached interpolation from {cache_path}")
+        return np.load(cache_path, mmap_mode='r')
+
+    print("Interpolating values...")
+    interpolator = LinearNDInterpolator(points, values, fill_value=0)
+    interpolated_values = interpolator(grid_points)
+    interpolated_values = interpolated_values.reshape(resolution, resolution, resolution)
+    np.save(cache_path, interpolated_values)
+    return interpolated_values
+
+def visualize_with_pyvista(x, y, z, values, threshold=100, resolution=50, source_file=None):
     # Create high-resolution grid
     x_min, x_max = x.min(), x.max()
     y_min, y_max = y.min(), y.max()
     z_min, z_max = z.min(), z.max()
     
-    # Create regular grid points
-    x_grid = np.linspace(x_min, x_max, resolution)
-    y_grid = np.linspace(y_min, y_max, resolution)
-    z_grid = np.linspace(z_min, z_max, resolution)
-    
-    # Create meshgrid
-    X, Y, Z = np.meshgrid(x_grid, y_grid, z_grid)
-    
+    # Create regular grid points (float32 halves bandwidth through the
+    # interpolation and rendering pipeline; PyVista accepts it)
+    x_grid = np.linspace(x_min, x_max, resolution, dtype=np.float32)
+    y_grid = np.linspace(y_min, y_max, resolution, dtype=np.float32)
+    z_grid = np.linspace(z_min, z_max, resolution, dtype=np.float32)
+
     # Prepare points for interpolation
     points = np.column_stack((x, y, z))
-    grid_points = np.column_stack((X.flatten(), Y.flatten(), Z.flatten()))
-    
-    # Interpolate values
-    print("Interpolating values...")
-    interpolated_values = griddata(points, values, grid_points, method='linear', fill_value=0)
-    interpolated_values = interpolated_values.reshape(resolution, resolution, resolution)
+
+    # Build the query grid as one contiguous (res^3, 3) array: broadcast
+    # meshgrid views are stacked straight into the final allocation, instead
+    # of three full 3-D temporaries plus a column_stack copy. ij indexing
+    # makes axis 0 the x axis, so the Fortran-order flatten handed to
+    # ImageData below lines up with its x-fastest point layout.
+    grid_points = np.stack(
+        np.meshgrid(x_grid, y_grid, z_grid, indexing='ij', copy=False), axis=-1
+    ).reshape(-1, 3)
+    
+    # Interpolate values: building the interpolator explicitly triangulates
+    # the points once and can be re-evaluated for other grids/thresholds,
+    # where griddata rebuilds the Delaunay triangulation on every call
+    if source_file is not None:
+        interpolated_values = interpolate_with_cache(source_file, points, values, grid_points, resolution)
+    else:
+        print("Interpolating values...")
+        interpolator = LinearNDInterpolator(points, values, fill_value=0)
+        interpolated_values = interpolator(grid_points)
+        interpolated_values = interpolated_values.reshape(resolution, resolution, resolution)
     
     # Create PyVista structured grid
     grid = pv.ImageData()
@@ -138,5 +177,6 @@ analyze_distribution(values)
 # Plot and save the distribution
 plot_permeability_distribution(values, filename)
 
-# Create visualization with threshold
-visualize_with_pyvista(x, y, z, values, threshold=100, resolution=50)
\ No newline at end of file
+# Create visualization with threshold (interpolation cached next to the
+# source file so reruns skip straight to rendering)
+visualize_with_pyvista(x, y, z, values, threshold=100, resolution=50, source_file=filename)
\ No newline at end of file
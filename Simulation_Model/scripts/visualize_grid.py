@@ -3,9 +3,31 @@ import pyvista as pv
 import pandas as pd
 import matplotlib.pyplot as plt  # Import Matplotlib for plotting
 
+from dat_loader import load_dat
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Optional: the numpy fallback below computes the same mask
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True)
+    def compute_opacity(values, threshold, visible_opacity):
+        # Fused single pass: the mask is computed in-cache instead of
+        # materializing the comparison and the where() result separately
+        out = np.empty_like(values)
+        for i in prange(values.size):
+            out[i] = visible_opacity if values[i] >= threshold else 0.0
+        return out
+else:
+    def compute_opacity(values, threshold, visible_opacity):
+        return np.where(values < threshold, 0.0, visible_opacity)
+
 def read_and_analyze_dat_file(filename):
-    # Read the data
-    data = np.loadtxt(filename)
+    # Read the data (cached fast loader: C-tokenizer parse on the first
+    # run, memory-mapped .npy on reruns)
+    data = load_dat(filename)
     
     # If the data is in x,y,z,value format (4 columns)
     if data.shape[1] >= 3:  # Check if we have at least x,y,z columns
@@ -51,14 +73,30 @@ data, nx, ny, nz, values = read_and_analyze_dat_file(filename)
 print(f"Data shape: {data.shape}")  # Should be (n, 3) or (n, 4)
 print(f"Values shape: {values.shape}")  # Should match the number of points
 
-# Create a structured grid from the geological data
-grid = pv.StructuredGrid()
-grid.points = data[:, :3]
-grid.dimensions = [nx, ny, nz]
-grid.point_data["values"] = values  # Assign random values to point data
+# Reconstruct the regular lattice explicitly: searchsorted maps every row to
+# its (ix, iy, iz) cell, so the values land in the right place no matter how
+# the .DAT file orders its rows (StructuredGrid with raw points silently
+# renders garbage unless the rows happen to be in K-major order)
+xs = np.unique(data[:, 0])
+ys = np.unique(data[:, 1])
+zs = np.unique(data[:, 2])
+V = np.zeros((nx, ny, nz), dtype=np.float32)
+V[
+    np.searchsorted(xs, data[:, 0]),
+    np.searchsorted(ys, data[:, 1]),
+    np.searchsorted(zs, data[:, 2])
+] = values
+
+# A rectilinear grid needs only the three coordinate axes instead of an
+# N x 3 points array - the per-point coordinates never hit the GPU - and,
+# unlike ImageData, stays correct when the lattice spacing is non-uniform
+# (thin z-layers are common in these reservoir grids)
+grid = pv.RectilinearGrid(xs, ys, zs)
+point_values = V.ravel(order='F')  # x varies fastest
+grid.point_data["values"] = point_values
 
-# Create a mask for opacity based on values
-opacity = np.where(values < 1000, 0, 0.7)  # Set opacity to 0 for values < 3000
+# Create a mask for opacity based on values (in grid point order)
+opacity = compute_opacity(point_values, 1000, 0.7)  # Hide cells below the threshold
 
 # Create the plotter
 plotter = pv.Plotter()
@@ -0,0 +1,773 @@
+#!/usr/bin/env python3
+"""
+Shared download-and-build pipeline for the GCS-backed datasets.
+
+The per-dataset scripts under Production_Data/scripts and
+Tracer_Data/scripts are thin shims over this module, so the storage
+client, ETag cache and download machinery are shared instead of being
+re-implemented (and re-imported) per copy. Run directly with
+--mode {production,tracer}, or import and call main().
+"""
+
+import asyncio
+import datetime
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+from google.cloud import storage
+import pandas as pd
+from typing import List
+
+try:
+    from google.cloud.storage import transfer_manager
+except ImportError:
+    # Older google-cloud-storage (<2.7) without the transfer manager;
+    # we fall back to a plain thread pool below.
+    transfer_manager = None
+
+try:
+    import aiohttp
+except ImportError:
+    # Optional async fast path; the threaded download paths cover its absence.
+    aiohttp = None
+
+# Blobs above this size get sliced, multi-connection downloads instead of a
+# single stream (same heuristic gsutil uses for composite transfers)
+LARGE_BLOB_THRESHOLD = 200 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+
+def set_gcp_credentials():
+    """
+    Set up GCP credentials from the service account key file.
+    The key file should be named 'service-account-key.json' and placed in the same directory as this script.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    credentials_path = os.path.join(script_dir, 'service-account-key.json')
+    
+    if not os.path.exists(credentials_path):
+        raise FileNotFoundError(
+            f"GCP credentials file not found at {credentials_path}. "
+            "Please place your service-account-key.json file in the same directory as this script."
+        )
+    
+    os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
+    print(f"GCP credentials set from: {credentials_path}")
+
+_CLIENT = None
+
+def get_storage_client():
+    """
+    Create the GCS client once per process and reuse it.
+
+    Instantiating storage.Client() re-reads credentials, resolves ADC and
+    opens a fresh HTTPS session each time - a fixed multi-hundred-ms cost.
+    The widened connection pool lets the parallel download workers reuse
+    TCP+TLS connections instead of re-handshaking.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = storage.Client()
+        try:
+            import requests.adapters
+            adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32)
+            _CLIENT._http.mount('https://', adapter)
+        except Exception:
+            # Non-requests transports keep their default pool
+            pass
+    return _CLIENT
+
+def reload_blob_metadata(blob):
+    """Fetch blob metadata (size, content encoding), ignoring failures.
+
+    Blobs that fail to reload (e.g. deleted from the bucket) surface their
+    error at download time instead.
+    """
+    try:
+        blob.reload()
+    except Exception:
+        pass
+
+def etag_matches(blob, destination_file: str) -> bool:
+    """Whether the local copy of a blob is still current.
+
+    Compares the blob's ETag (from a prior reload) against the sidecar
+    .etag file written after the last successful download.
+    """
+    if blob.etag is None:
+        return False
+    etag_file = destination_file + '.etag'
+    try:
+        if os.path.exists(destination_file) and os.path.exists(etag_file):
+            with open(etag_file) as f:
+                return f.read() == blob.etag
+    except OSError:
+        pass
+    return False
+
+def record_etag(etag, destination_file: str):
+    """Persist a blob's ETag next to its downloaded copy.
+
+    Takes the ETag value captured after the metadata reload: the download
+    calls themselves reset the blob's cached properties.
+    """
+    if not etag:
+        return
+    try:
+        with open(destination_file + '.etag', 'w') as f:
+            f.write(etag)
+    except OSError:
+        pass
+
+def fetch_blob_bytes(blob, cache_folder=None):
+    """
+    Return the blob's bytes, serving unchanged blobs from the local cache.
+
+    With a cache folder, the blob's ETag is checked against the sidecar
+    written on the previous run: a match means only the metadata request
+    touches the network and the bytes come straight from disk.
+    """
+    if cache_folder is None:
+        return blob.download_as_bytes()
+
+    cache_file = os.path.join(cache_folder, os.path.basename(blob.name))
+    reload_blob_metadata(blob)
+    if etag_matches(blob, cache_file):
+        print(f"Skipping {blob.name}: local copy is up to date")
+        with open(cache_file, 'rb') as f:
+            return f.read()
+
+    etag = blob.etag
+    data = blob.download_as_bytes()
+    with open(cache_file, 'wb') as f:
+        f.write(data)
+    record_etag(etag, cache_file)
+    return data
+
+def media_download_url(bucket_name: str, blob_name: str) -> str:
+    """JSON API media endpoint for a blob (honors STORAGE_EMULATOR_HOST)."""
+    base = os.environ.get('STORAGE_EMULATOR_HOST', 'https://storage.googleapis.com')
+    return f"{base}/download/storage/v1/b/{bucket_name}/o/{quote(blob_name, safe='')}?alt=media"
+
+def bearer_token(storage_client):
+    """Access token for the media endpoint, or None for anonymous access."""
+    try:
+        import google.auth.transport.requests
+        credentials = storage_client._credentials
+        if not credentials.valid:
+            credentials.refresh(google.auth.transport.requests.Request())
+        return credentials.token
+    except Exception:
+        return None
+
+def download_many_async(storage_client, blob_file_pairs) -> List:
+    """
+    Download blobs concurrently over a single aiohttp session.
+
+    Coroutines coalesce TLS handshakes onto one connector and overlap every
+    transfer without per-thread overhead. Prefers signed URLs (no auth header
+    needed per request); falls back to the JSON API media endpoint with a
+    bearer token when the credentials cannot sign (e.g. plain ADC).
+
+    Returns one entry per pair: None on success or the exception raised for
+    that blob, mirroring transfer_manager.download_many.
+    """
+    async def _download_one(session, url, destination_file):
+        async with session.get(url) as response:
+            response.raise_for_status()
+            with open(destination_file, 'wb') as f:
+                async for chunk in response.content.iter_chunked(1 << 20):
+                    f.write(chunk)
+
+    async def _download_all(url_path_pairs, headers):
+        connector = aiohttp.TCPConnector(limit=32)
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            return await asyncio.gather(
+                *(_download_one(session, url, path) for url, path in url_path_pairs),
+                return_exceptions=True
+            )
+
+    try:
+        # Signed URLs carry their own auth, so no header may be attached
+        url_path_pairs = [
+            (blob.generate_signed_url(version='v4', expiration=datetime.timedelta(hours=1)), path)
+            for blob, path in blob_file_pairs
+        ]
+        headers = {}
+    except Exception:
+        token = bearer_token(storage_client)
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        url_path_pairs = [
+            (media_download_url(blob.bucket.name, blob.name), path)
+            for blob, path in blob_file_pairs
+        ]
+
+    return asyncio.run(_download_all(url_path_pairs, headers))
+
+def ensure_directory(directory: str):
+    """Create directory if it doesn't exist."""
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+def download_from_gcp(bucket_name: str, file_names: List[str], destination_folder: str) -> List[str]:
+    """
+    Download specific files from GCP bucket to local folder.
+    
+    Args:
+        bucket_name: Name of the GCP bucket
+        file_names: List of file names to download from the bucket
+        destination_folder: Local folder to save downloaded files
+        
+    Returns:
+        List of downloaded file paths
+    """
+    # Ensure the destination folder exists
+    ensure_directory(destination_folder)
+
+    try:
+        # Shared per-process client (thread-safe across the download workers)
+        storage_client = get_storage_client()
+        bucket = storage_client.bucket(bucket_name)
+
+        # Pair each blob with its local destination so the downloads can
+        # run concurrently - the loop is I/O-bound, so overlapping the
+        # transfers gives a near-linear speedup over the old serial loop.
+        blob_file_pairs = [
+            (bucket.blob(file_name), os.path.join(destination_folder, os.path.basename(file_name)))
+            for file_name in file_names
+        ]
+
+        # Fetch object metadata up front (in parallel) so unchanged blobs
+        # can be skipped and oversized blobs routed to the sliced path below
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(reload_blob_metadata, (blob for blob, _ in blob_file_pairs)))
+
+        result_by_path = {}
+        etag_by_path = {path: blob.etag for blob, path in blob_file_pairs}
+
+        # Blobs whose stored ETag still matches need no transfer at all -
+        # repeated runs cost one metadata request per blob
+        fresh_pairs = []
+        for blob, path in blob_file_pairs:
+            if etag_matches(blob, path):
+                print(f"Skipping {blob.name}: local copy is up to date")
+                result_by_path[path] = None
+            else:
+                fresh_pairs.append((blob, path))
+
+        if transfer_manager is not None:
+            small_pairs = [
+                (blob, path) for blob, path in fresh_pairs
+                if blob.size is None or blob.size <= LARGE_BLOB_THRESHOLD
+            ]
+            large_pairs = [
+                (blob, path) for blob, path in fresh_pairs
+                if blob.size is not None and blob.size > LARGE_BLOB_THRESHOLD
+            ]
+        else:
+            # Without the transfer manager there is no sliced path
+            small_pairs, large_pairs = list(fresh_pairs), []
+
+        if small_pairs:
+            if aiohttp is not None:
+                small_results = download_many_async(storage_client, small_pairs)
+            elif transfer_manager is not None:
+                # raw_download skips decompressive-transcoding overhead on
+                # each request; only safe when no object is gzip-encoded
+                raw_download = all(
+                    blob.content_encoding != 'gzip' for blob, _ in small_pairs
+                )
+                small_results = transfer_manager.download_many(
+                    small_pairs,
+                    max_workers=16,
+                    worker_type=transfer_manager.THREAD,
+                    download_kwargs={'raw_download': raw_download}
+                )
+            else:
+                # Fallback: plain thread pool around download_to_filename
+                def _download(pair):
+                    blob, destination_file = pair
+                    blob.download_to_filename(destination_file)
+
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    futures = [executor.submit(_download, pair) for pair in small_pairs]
+                    small_results = [future.exception() for future in futures]
+
+            for (blob, path), result in zip(small_pairs, small_results):
+                result_by_path[path] = result
+
+        # Large blobs: multiple ranged GETs saturate bandwidth a single
+        # HTTP connection cannot
+        for blob, path in large_pairs:
+            try:
+                transfer_manager.download_chunks_concurrently(
+                    blob,
+                    path,
+                    chunk_size=DOWNLOAD_CHUNK_SIZE,
+                    max_workers=8
+                )
+                result_by_path[path] = None
+            except Exception as e:
+                result_by_path[path] = e
+
+        # Remember what we just fetched so the next run can skip it
+        for blob, path in fresh_pairs:
+            if not isinstance(result_by_path.get(path), Exception):
+                record_etag(etag_by_path.get(path), path)
+
+        results = [result_by_path[path] for _, path in blob_file_pairs]
+
+        downloaded_files = []
+        fresh_paths = {path for _, path in fresh_pairs}
+
+        # transfer_manager returns one entry per blob: None on success,
+        # or the exception raised for that blob
+        for (blob, destination_file), result in zip(blob_file_pairs, results):
+            if isinstance(result, Exception):
+                print(f"Error downloading {blob.name}: {str(result)}")
+            else:
+                if destination_file in fresh_paths:
+                    print(f"Downloaded: {blob.name} to {destination_file}")
+                downloaded_files.append(destination_file)
+
+        if not downloaded_files:
+            raise Exception("No files were downloaded successfully")
+
+        return downloaded_files
+
+    except Exception as e:
+        print(f"Error accessing GCP bucket: {str(e)}")
+        print("Please verify your credentials and bucket configuration.")
+        raise
+
+def process_json(file_path: str) -> pd.DataFrame:
+    """
+    Process a single JSON file and return a properly formatted DataFrame.
+    The DataFrame will be indexed by Date and sorted chronologically from past to present.
+    Only includes Flow, Press, and Temp columns with their respective units.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        pd.DataFrame: Processed DataFrame with Date index and filtered columns
+    """
+    with open(file_path, 'rb') as f:
+        return parse_well_json(f.read())
+
+def parse_well_json(raw: bytes) -> pd.DataFrame:
+    """
+    Parse raw well-JSON bytes into the processed, Date-indexed DataFrame.
+
+    Separated from process_json so downloaded payloads can be parsed
+    straight from memory without staging to disk first.
+    """
+    # Parse JSON (orjson parses 2-5x faster than the stdlib when present)
+    try:
+        import orjson
+        json_data = orjson.loads(raw)
+    except ImportError:
+        import json
+        json_data = json.loads(raw)
+
+    # Pivot list-of-records payloads to columnar arrays first so DataFrame
+    # construction doesn't hash every key once per row; union the keys so
+    # columns appearing partway through the file are kept (as pd.DataFrame
+    # would)
+    if isinstance(json_data, list) and json_data:
+        keys = dict.fromkeys(key for record in json_data for key in record)
+        columns = {key: [record.get(key) for record in json_data] for key in keys}
+        df = pd.DataFrame(columns)
+    else:
+        df = pd.DataFrame(json_data)
+    
+    # Ensure Date column exists
+    if 'Date' not in df.columns:
+        raise ValueError("No 'Date' column found in well JSON payload")
+    
+    # Map each measurement keyword to its unit suffix; a single pass over
+    # the columns both selects the Flow/Press/Temp columns and builds their
+    # renamed headers
+    units = {'Flow': ' (gpm)', 'Press': ' (psi)', 'Temp': ' (F)'}
+    column_mapping = {
+        col: col + suffix
+        for col in df.columns
+        if (suffix := next((units[k] for k in units if k in col), None))
+    }
+
+    # Keep only the mapped columns plus Date, renamed with their units
+    df = df[['Date', *column_mapping]].rename(columns=column_mapping)
+    
+    # Convert Date to datetime (cache=True deduplicates repeated timestamps -
+    # well data has many rows per day), then truncate to days and stringify
+    # in one C-level dtype cast instead of materializing a Python date
+    # object per row via .dt.date
+    df['Date'] = pd.to_datetime(df['Date'], cache=True).values.astype('datetime64[D]').astype(str)
+    df.set_index('Date', inplace=True)
+    
+    # Sort index chronologically (oldest to newest)
+    df.sort_index(inplace=True)
+    
+    return df
+
+def col_width(series, header):
+    """
+    Column width for a series: the longest rendered value (str.len runs
+    in C, no per-cell Python calls) or the header, plus padding.
+    """
+    return max(int(series.astype(str).str.len().max()), len(header)) + 2
+
+def write_well_sheet(writer, well_name: str, df: pd.DataFrame, numeric_format, header_format):
+    """
+    Stream one well's DataFrame into a new worksheet.
+
+    Column widths and formats must be declared before the rows are written
+    in constant_memory mode; rows go out strictly in increasing order
+    (df.to_excel emits cells column-major, which would silently drop
+    already-flushed rows).
+    """
+    worksheet = writer.book.add_worksheet(well_name)
+    writer.sheets[well_name] = worksheet
+
+    # First column (0) is the index (Date)
+    worksheet.set_column(0, 0, 12)  # Date column width (shorter now)
+
+    for idx, col in enumerate(df.columns, start=1):  # Start from second column
+        # Numeric columns get the shared 0.00 format in O(1)
+        cell_format = numeric_format if df[col].dtype in ['float64', 'int64'] else None
+        worksheet.set_column(idx, idx, col_width(df[col], col), cell_format)
+
+    worksheet.write_row(0, 0, ['Date', *df.columns], header_format)
+    for row_number, row in enumerate(df.itertuples(index=True, name=None), start=1):
+        worksheet.write_row(row_number, 0, [None if pd.isna(value) else value for value in row])
+
+def download_and_combine(bucket_name: str, file_names: List[str], output_path: str, cache_folder: str = None):
+    """
+    Download well JSONs and build the Excel mastersheet in one fused pipeline.
+
+    Blobs are fetched concurrently as bytes and parsed straight from memory,
+    so parsing and sheet writing overlap with the in-flight downloads.
+    Futures are consumed in submission order to keep the sheet order
+    deterministic.
+
+    Args:
+        bucket_name: Name of the GCP bucket
+        file_names: List of file names to download from the bucket
+        output_path: Path where the Excel file will be saved
+        cache_folder: Optional folder holding raw copies with ETag sidecars;
+            unchanged blobs are served from it without a transfer
+    """
+    # Change output extension to xlsx
+    output_path = output_path.replace('.csv', '.xlsx')
+
+    try:
+        # Shared per-process client (thread-safe across the download workers)
+        storage_client = get_storage_client()
+        bucket = storage_client.bucket(bucket_name)
+    except Exception as e:
+        print(f"Error accessing GCP bucket: {str(e)}")
+        print("Please verify your credentials and bucket configuration.")
+        raise
+
+    # Build the workbook next to the final path and swap it in afterwards,
+    # so a failed run can't clobber the previous mastersheet
+    temp_path = output_path.replace('.xlsx', '.partial.xlsx')
+    processed_wells = 0
+
+    with ThreadPoolExecutor(max_workers=16) as executor, pd.ExcelWriter(
+        temp_path,
+        engine='xlsxwriter',
+        datetime_format='yyyy-mm-dd',
+        engine_kwargs={'options': {'constant_memory': True}}
+    ) as writer:
+        numeric_format = writer.book.add_format({'num_format': '0.00'})
+        header_format = writer.book.add_format({'bold': True})
+
+        futures = [
+            (file_name, executor.submit(fetch_blob_bytes, bucket.blob(file_name), cache_folder))
+            for file_name in file_names
+        ]
+
+        for file_name, future in futures:
+            well_name = os.path.basename(file_name).replace('.json', '')
+            try:
+                df = parse_well_json(future.result())
+                write_well_sheet(writer, well_name, df, numeric_format, header_format)
+                processed_wells += 1
+                print(f"Processed {well_name} data with columns: {', '.join(df.columns)}")
+            except Exception as e:
+                print(f"Error processing {file_name}: {str(e)}")
+
+    if processed_wells == 0:
+        os.remove(temp_path)
+        raise Exception("No files were downloaded successfully")
+
+    os.replace(temp_path, output_path)
+    print(f"\nCreated Excel workbook with multiple sheets at: {output_path}")
+
+def combine_json_files(file_paths: List[str], output_path: str):
+    """
+    Process multiple JSON files into separate sheets in an Excel file.
+    Each JSON file will be transformed into a DataFrame with its own sheet.
+    Each sheet will have Date as index, sorted chronologically.
+    
+    Args:
+        file_paths: List of JSON file paths to combine
+        output_path: Path where the Excel file will be saved
+    """
+    # Change output extension to xlsx
+    output_path = output_path.replace('.csv', '.xlsx')
+    
+    # Create Excel writer object; constant_memory streams rows straight to
+    # the archive instead of buffering every cell object in RAM
+    with pd.ExcelWriter(
+        output_path,
+        engine='xlsxwriter',
+        datetime_format='yyyy-mm-dd',
+        engine_kwargs={'options': {'constant_memory': True}}
+    ) as writer:
+        # One shared format object, applied per column instead of per cell
+        numeric_format = writer.book.add_format({'num_format': '0.00'})
+
+        header_format = writer.book.add_format({'bold': True})
+
+        for file_path in file_paths:
+            try:
+                # Get well name from file name (remove .json extension)
+                well_name = os.path.basename(file_path).replace('.json', '')
+
+                # Process JSON file into DataFrame and stream it out
+                df = process_json(file_path)
+                write_well_sheet(writer, well_name, df, numeric_format, header_format)
+
+                print(f"Processed {well_name} data with columns: {', '.join(df.columns)}")
+
+            except Exception as e:
+                print(f"Error processing {file_path}: {str(e)}")
+                continue
+    
+    print(f"\nCreated Excel workbook with multiple sheets at: {output_path}")
+
+def analyze_excel_file(file_path: str):
+    """
+    Read and analyze the structure of the Excel file.
+    Print out information about sheets, columns, and data types.
+    
+    Args:
+        file_path: Path to the Excel file
+    """
+    print(f"\nAnalyzing Excel file: {file_path}")
+    
+    # Read all sheets
+    excel_file = pd.ExcelFile(file_path)
+    print(f"\nFound sheets: {excel_file.sheet_names}")
+    
+    # Analyze each sheet
+    for sheet_name in excel_file.sheet_names:
+        print(f"\nAnalyzing sheet: {sheet_name}")
+        
+        # Read the sheet through the already-parsed workbook handle
+        # (re-passing the path would re-unzip and re-parse the archive)
+        df = pd.read_excel(excel_file, sheet_name=sheet_name)
+        
+        # Print basic information
+        print(f"Number of rows: {len(df)}")
+        print(f"Number of columns: {len(df.columns)}")
+        print("\nColumns and their data types:")
+        for col in df.columns:
+            print(f"- {col}: {df[col].dtype}")
+        
+        # Print first few rows
+        print("\nFirst few rows of data:")
+        print(df.head())
+        print("\n" + "="*80)
+
+def write_frame_sheet(writer, sheet_name, df, numeric_format, header_format, date_format=None):
+    """
+    Stream a DataFrame (without its index) into a new worksheet.
+
+    Same constant_memory streaming discipline as write_well_sheet:
+    column widths and formats are declared first, then rows go out in
+    strictly increasing order.
+    """
+    worksheet = writer.book.add_worksheet(sheet_name)
+    writer.sheets[sheet_name] = worksheet
+
+    for idx, col in enumerate(df.columns):
+        if df[col].dtype.kind == 'M':
+            # Datetime columns get a fixed width and the date format
+            worksheet.set_column(idx, idx, 12, date_format)
+            continue
+
+        cell_format = numeric_format if df[col].dtype in ['float64', 'int64'] else None
+        worksheet.set_column(idx, idx, col_width(df[col], col), cell_format)
+
+    worksheet.write_row(0, 0, list(df.columns), header_format)
+    for row_number, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_number, 0, [None if pd.isna(value) else value for value in row])
+
+def process_excel_file(input_path: str, output_path: str):
+    """
+    Process the Excel file:
+    1. Keep the Overview sheet unchanged
+    2. Split the raw data into separate sheets by year using the Year column
+    
+    Args:
+        input_path: Path to the input Excel file
+        output_path: Path to save the processed Excel file
+    """
+    print(f"\nProcessing Excel file: {input_path}")
+    
+    # Read the Excel file
+    excel_file = pd.ExcelFile(input_path)
+    
+    # Create Excel writer for output; constant_memory streams cells
+    # straight to the archive instead of buffering every cell object
+    with pd.ExcelWriter(
+        output_path,
+        engine='xlsxwriter',
+        engine_kwargs={'options': {'constant_memory': True}}
+    ) as writer:
+        numeric_format = writer.book.add_format({'num_format': '0.00'})
+        header_format = writer.book.add_format({'bold': True})
+        date_format = writer.book.add_format({'num_format': 'yyyy-mm-dd'})
+
+        # Copy Overview sheet unchanged
+        if 'Overview' in excel_file.sheet_names:
+            # Read through the parsed workbook handle instead of re-parsing
+            # the archive from the path
+            df_overview = pd.read_excel(excel_file, sheet_name='Overview')
+            write_frame_sheet(writer, 'Overview', df_overview, numeric_format, header_format, date_format)
+            print("Copied Overview sheet")
+        
+        # Process raw data
+        df_raw = pd.read_excel(excel_file, sheet_name='Raw data')
+        
+        # Get unique years from Year column
+        years = sorted(df_raw['Year'].unique())
+        print(f"\nFound years in data: {years}")
+        
+        # Show count of entries per year
+        year_counts = df_raw['Year'].value_counts().sort_index()
+        print("\nNumber of entries per year:")
+        print(year_counts)
+        
+        # Create a sheet for each year, streamed with per-column formats
+        for year in years:
+            # Filter data for this year
+            df_year = df_raw[df_raw['Year'] == year]
+
+            sheet_name = f'Data_{year}'
+            write_frame_sheet(writer, sheet_name, df_year, numeric_format, header_format, date_format)
+            print(f"\nCreated sheet for year {year} with {len(df_year)} rows")
+
+    # Parquet mirror of the raw data: loads in milliseconds downstream and
+    # the Year partitioning gives per-year predicate pushdown
+    try:
+        parquet_path = os.path.splitext(output_path)[0] + '.parquet'
+        if os.path.isdir(parquet_path):
+            shutil.rmtree(parquet_path)  # partition dirs append otherwise
+        df_raw.to_parquet(parquet_path, engine='pyarrow', compression='zstd',
+                          partition_cols=['Year'])
+        print(f"Wrote Parquet mirror to: {parquet_path}")
+    except ImportError:
+        # pyarrow not installed; the workbook remains the only output
+        pass
+    
+    print(f"\nCreated processed Excel file at: {output_path}")
+
+def build_production_mastersheet(parent_dir: str):
+    """Build the per-well production mastersheet under parent_dir."""
+    # Set up GCP credentials
+    # set_gcp_credentials()
+
+    # Configuration
+    BUCKET_NAME = "comsol_ldg"  # Replace with your bucket name
+    prefix = 'Eagle_Vision_Working_Data_Warehouse/'  # Added trailing slash for path joining
+
+    base_files = [
+        "13-7.json",
+        "17-7.json",
+        "32-18.json",
+        "45-7.json",
+        "45A-7.json",
+        "53-7ST.json",
+        "55-7.json",
+        "63-7.json",
+        "66-7.json",
+        "66A-7.json",
+        "75-7.json",
+        "76-7.json"
+    ]
+
+    # Create full file paths by joining prefix with each file name
+    FILE_NAMES = [prefix + file_name for file_name in base_files]
+
+    MASTERSHEET_PATH = os.path.join(parent_dir, "CleanData/Production.xlsx")  # Changed to xlsx
+
+    # Ensure CleanData directory exists
+    ensure_directory(os.path.dirname(MASTERSHEET_PATH))
+
+    RAW_DATA_FOLDER = os.path.join(parent_dir, "RawData")
+    ensure_directory(RAW_DATA_FOLDER)
+
+    # Download and combine in one fused pipeline: blobs are parsed from
+    # memory as they arrive, with RawData acting as an ETag-keyed cache so
+    # unchanged blobs are not re-transferred on repeat runs
+    download_and_combine(
+        bucket_name=BUCKET_NAME,
+        file_names=FILE_NAMES,
+        output_path=MASTERSHEET_PATH,
+        cache_folder=RAW_DATA_FOLDER
+    )
+
+def build_tracer_mastersheet(parent_dir: str):
+    """Download and split the tracer workbook under parent_dir."""
+    # Set up GCP credentials
+    # set_gcp_credentials()
+
+    # Configuration
+    BUCKET_NAME = "comsol_ldg"  # Replace with your bucket name
+    FILE_NAME = 'Eagle_Vision_Working_Data_Warehouse/Tracer_Data_Compiled.xlsx'
+
+    RAW_DATA_FOLDER = os.path.join(parent_dir, "RawData")
+    CLEAN_DATA_FOLDER = os.path.join(parent_dir, "CleanData")
+
+    INPUT_PATH = os.path.join(RAW_DATA_FOLDER, "Tracer_Data_Compiled.xlsx")
+    OUTPUT_PATH = os.path.join(CLEAN_DATA_FOLDER, "Tracer.xlsx")
+
+    # Ensure directories exist
+    ensure_directory(RAW_DATA_FOLDER)
+    ensure_directory(CLEAN_DATA_FOLDER)
+
+    # Download file from GCP (parallel machinery and the ETag skip come
+    # along for free from the shared download path)
+    download_from_gcp(
+        bucket_name=BUCKET_NAME,
+        file_names=[FILE_NAME],
+        destination_folder=RAW_DATA_FOLDER
+    )
+
+    # Process the Excel file
+    process_excel_file(INPUT_PATH, OUTPUT_PATH)
+
+def main(mode: str, parent_dir: str = None):
+    """Entry point shared by the per-dataset shim scripts and the CLI."""
+    repo_root = os.path.dirname(os.path.abspath(__file__))
+    if mode == 'production':
+        build_production_mastersheet(parent_dir or os.path.join(repo_root, 'Production_Data'))
+    elif mode == 'tracer':
+        build_tracer_mastersheet(parent_dir or os.path.join(repo_root, 'Tracer_Data'))
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Download and build a dataset mastersheet")
+    parser.add_argument('--mode', choices=['production', 'tracer'], required=True,
+                        help="Which pipeline to run")
+    parser.add_argument('--data-dir', default=None,
+                        help="Dataset folder (defaults to <repo>/Production_Data or <repo>/Tracer_Data)")
+    args = parser.parse_args()
+    main(args.mode, args.data_dir)